@@ -1,6 +1,13 @@
 import pygame
 import math
+import os
 import random
+import itertools
+
+import numpy as np
+
+import telemetry
+import timer_wheel
 
 # === INITIALIZATION ===
 pygame.init()
@@ -9,6 +16,7 @@ pygame.init()
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+TELEMETRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "telemetry") # Match event files; None disables recording
 
 # Colors
 WHITE = (255, 255, 255)
@@ -28,32 +36,146 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Fortnite 2D - Overhaul")
 clock = pygame.time.Clock()
 
+# Spectator zoom: each level halves the area of the last (1x down to 1/8x)
+ZOOM_LEVELS = [1 / 2 ** (i / 2) for i in range(7)]
+DOT_THRESHOLD = 6 # Sprites smaller than this on screen are drawn as dots
+PAN_SPEED = 15
+
 # Camera
 class Camera:
     def __init__(self, width, height):
         self.camera = pygame.Rect(0, 0, width, height)
         self.width = width
         self.height = height
+        self.center = pygame.math.Vector2(0, 0)
+        self.zoom_level = 0
+        self.zoom = 1
+        self.spectating = False
 
     def apply(self, entity):
-        return entity.rect.move(self.camera.topleft)
+        return self.apply_rect(entity.rect)
 
     def apply_rect(self, rect):
-        return rect.move(self.camera.topleft)
+        if self.zoom == 1:
+            return rect.move(self.camera.topleft)
+        x, y = self.apply_pos(rect.topleft)
+        return pygame.Rect(int(x), int(y), math.ceil(rect.width * self.zoom), math.ceil(rect.height * self.zoom))
         
     def apply_pos(self, pos):
-        return (pos[0] + self.camera.x, pos[1] + self.camera.y)
+        if self.zoom == 1:
+            return (pos[0] + self.camera.x, pos[1] + self.camera.y)
+        return ((pos[0] - self.center.x) * self.zoom + self.width / 2,
+                (pos[1] - self.center.y) * self.zoom + self.height / 2)
+
+    def screen_to_world(self, pos):
+        return pygame.math.Vector2((pos[0] - self.width / 2) / self.zoom + self.center.x,
+                                   (pos[1] - self.height / 2) / self.zoom + self.center.y)
+
+    def world_view(self):
+        # Visible area in world coordinates
+        w, h = self.width / self.zoom, self.height / self.zoom
+        return pygame.Rect(int(self.center.x - w / 2), int(self.center.y - h / 2), int(w) + 1, int(h) + 1)
+
+    def set_zoom_level(self, level):
+        self.zoom_level = max(0, min(len(ZOOM_LEVELS) - 1, level))
+        self.zoom = ZOOM_LEVELS[self.zoom_level]
+
+    def toggle_spectate(self):
+        self.spectating = not self.spectating
+        if not self.spectating:
+            self.set_zoom_level(0)
+
+    def pan(self, dx, dy):
+        # Keep the pan speed constant on screen
+        self.center.x += dx * PAN_SPEED / self.zoom
+        self.center.y += dy * PAN_SPEED / self.zoom
 
     def update(self, target):
-        x = -target.rect.centerx + int(SCREEN_WIDTH / 2)
-        y = -target.rect.centery + int(SCREEN_HEIGHT / 2)
+        if not self.spectating:
+            self.center = pygame.math.Vector2(target.rect.center)
+        x = -int(self.center.x) + int(SCREEN_WIDTH / 2)
+        y = -int(self.center.y) + int(SCREEN_HEIGHT / 2)
         
         # Optional: Limit scrolling to map size? (Infinite for now)
         self.camera = pygame.Rect(x, y, self.width, self.height)
 
+    def scaled(self, sprite):
+        # Scaled copies of the sprite's image, one per zoom level (mipmap
+        # style), kept on the sprite until it swaps its image
+        cache = getattr(sprite, "zoom_cache", None)
+        levels = cache[3] if cache is not None and cache[0] is sprite.image else {}
+        scaled = levels.get(self.zoom_level)
+        if scaled is None:
+            w, h = sprite.image.get_size()
+            size = (max(1, math.ceil(w * self.zoom)), max(1, math.ceil(h * self.zoom)))
+            scaled = levels[self.zoom_level] = pygame.transform.smoothscale(sprite.image, size)
+        level = self.zoom_level
+        if getattr(sprite, "fades", False):
+            # Particles fade by changing the alpha of their image, so they
+            # never take the fast path in draw()
+            scaled.set_alpha(sprite.image.get_alpha())
+            level = None
+        sprite.zoom_cache = (sprite.image, level, scaled, levels)
+        return scaled
+
+    def draw(self, surface, sprites):
+        sprites = list(sprites)
+        if not sprites:
+            return
+        if self.zoom == 1:
+            rects = [sprite.rect for sprite in sprites]
+            view = pygame.Rect(-self.camera.x, -self.camera.y, self.width, self.height)
+            surface.blits([(sprites[i].image, rects[i].move(self.camera.topleft)) for i in view.collidelistall(rects)], False)
+            return
+
+        # Cull and sort into images and dots for the whole group at once
+        rects = np.fromiter((v for sprite in sprites for v in sprite.rect), np.int32, 4 * len(sprites)).reshape(-1, 4)
+        x, y, w, h = rects.T
+        view = self.world_view()
+        visible = (x < view.right) & (x + w > view.left) & (y < view.bottom) & (y + h > view.top)
+        dot_size = DOT_THRESHOLD / self.zoom
+        small = (w < dot_size) & (h < dot_size)
+        big = np.nonzero(visible & ~small)[0]
+        dots = np.nonzero(visible & small)[0]
+
+        level = self.zoom_level
+        images = []
+        for i in big.tolist():
+            sprite = sprites[i]
+            cache = getattr(sprite, "zoom_cache", None)
+            if cache is not None and cache[1] == level and cache[0] is sprite.image:
+                images.append(cache[2])
+            else:
+                images.append(self.scaled(sprite))
+        xs = (x[big] * self.zoom + (self.width / 2 - self.center.x * self.zoom)).astype(np.int32)
+        ys = (y[big] * self.zoom + (self.height / 2 - self.center.y * self.zoom)).astype(np.int32)
+        surface.blits(zip(images, zip(xs.tolist(), ys.tolist())), False)
+        if len(dots):
+            centers = np.stack([x[dots] + w[dots] // 2, y[dots] + h[dots] // 2], axis=1)
+            self.draw_dots(surface, centers, [sprites[i].dot_color for i in dots.tolist()])
+
+    def draw_dots(self, surface, centers, colors):
+        # Far away entities become 2x2 colored points, written in one batch
+        colors = np.array(colors, dtype=np.uint8)
+        xs = ((centers[:, 0] - self.center.x) * self.zoom + self.width / 2).astype(np.int32)
+        ys = ((centers[:, 1] - self.center.y) * self.zoom + self.height / 2).astype(np.int32)
+        w, h = surface.get_size()
+        inside = (xs >= 0) & (xs < w - 1) & (ys >= 0) & (ys < h - 1)
+        xs, ys, colors = xs[inside], ys[inside], colors[inside]
+        pixels = pygame.surfarray.pixels3d(surface)
+        for dx in (0, 1):
+            for dy in (0, 1):
+                pixels[xs + dx, ys + dy] = colors
+        del pixels # Unlock the surface
+
+timers = timer_wheel.TimerWheel()
+recorder = telemetry.Telemetry(TELEMETRY_DIR, lambda: timers.now)
+
 # === CLASSES ===
 
 class Particle(pygame.sprite.Sprite):
+    fades = True # Alpha changes every frame (see Camera.scaled)
+
     def __init__(self, pos, color, size, life):
         super().__init__()
         self.image = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -61,20 +183,19 @@ class Particle(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=pos)
         self.pos = pygame.math.Vector2(pos)
         self.vel = pygame.math.Vector2(random.uniform(-2, 2), random.uniform(-2, 2))
-        self.life = life
+        self.dot_color = color
         self.original_life = life
+        self.expires = timers.now + life
+        timers.schedule(life, self.kill)
 
     def update(self):
         self.pos += self.vel
         self.rect.center = self.pos
-        self.life -= 1
         
         # Fade out
-        alpha = int(255 * (self.life / self.original_life))
+        life = self.expires - timers.now
+        alpha = int(255 * (life / self.original_life))
         self.image.set_alpha(alpha)
-        
-        if self.life <= 0:
-            self.kill()
 
 class Weapon:
     def __init__(self, name, damage, fire_rate, spread, count, color):
@@ -84,14 +205,17 @@ class Weapon:
         self.spread = spread
         self.projectile_count = count
         self.color = color
-        self.cooldown = 0
+        self.ready_at = 0 # Tick when the next shot is allowed
+        self.holstered_ticks = 0 # Cooldown left when put away; it only runs in hand
     
     def can_shoot(self):
-        return self.cooldown <= 0
-        
-    def update(self):
-        if self.cooldown > 0:
-            self.cooldown -= 1
+        return timers.now >= self.ready_at
+
+    def holster(self):
+        self.holstered_ticks = max(self.ready_at - timers.now, 0)
+
+    def equip(self):
+        self.ready_at = timers.now + self.holstered_ticks
 
 class Pistol(Weapon):
     def __init__(self):
@@ -115,6 +239,7 @@ class Player(pygame.sprite.Sprite):
         self.health = 100
         self.materials = 50
         self.kills = 0
+        self.dot_color = BLUE_PLAYER
         
         self.weapons = [Pistol(), AR(), Shotgun()]
         self.current_weapon_index = 0
@@ -155,15 +280,18 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_3]: self.switch_weapon(2)
 
     def switch_weapon(self, index):
-        if 0 <= index < len(self.weapons):
+        if 0 <= index < len(self.weapons) and index != self.current_weapon_index:
+            self.current_weapon.holster()
             self.current_weapon_index = index
             self.current_weapon = self.weapons[index]
+            self.current_weapon.equip()
 
-    def rotate(self, camera_offset):
+    def rotate(self, camera):
         mouse_x, mouse_y = pygame.mouse.get_pos()
         # Adjust mouse pos for camera
-        rel_x = mouse_x - (self.rect.centerx + camera_offset[0])
-        rel_y = mouse_y - (self.rect.centery + camera_offset[1])
+        screen_x, screen_y = camera.apply_pos(self.rect.center)
+        rel_x = mouse_x - screen_x
+        rel_y = mouse_y - screen_y
         angle = (180 / math.pi) * -math.atan2(rel_y, rel_x)
         
         self.image = pygame.transform.rotate(self.original_image, int(angle))
@@ -171,7 +299,7 @@ class Player(pygame.sprite.Sprite):
     
     def shoot(self, target_pos, group_bullets, group_all):
         if self.current_weapon.can_shoot():
-            self.current_weapon.cooldown = self.current_weapon.fire_rate
+            self.current_weapon.ready_at = timers.now + self.current_weapon.fire_rate
             
             # Vector to target
             direction = target_pos - self.pos
@@ -183,19 +311,22 @@ class Player(pygame.sprite.Sprite):
                     angle = random.uniform(-self.current_weapon.spread, self.current_weapon.spread)
                     rotated_dir = base_dir.rotate_rad(angle)
                     
-                    bullet = Bullet(self.rect.center, rotated_dir, self.current_weapon.damage, True, YELLOW_BULLET)
+                    bullet = Bullet(self.rect.center, rotated_dir, self.current_weapon.damage, True, YELLOW_BULLET, self.current_weapon.name)
                     group_bullets.add(bullet)
                     group_all.add(bullet)
 
-    def update(self, camera_offset=None):
-        self.current_weapon.update()
+    def update(self, camera=None):
         self.get_input()
-        if camera_offset:
-            self.rotate(camera_offset)
+        if camera:
+            self.rotate(camera)
 
 class Bot(pygame.sprite.Sprite):
+    STATES = ("WANDER", "CHASE", "FLEE_STORM")
+    ids = itertools.count()
+
     def __init__(self):
         super().__init__()
+        self.id = next(Bot.ids)
         size = 40
         self.original_image = pygame.Surface((size, size), pygame.SRCALPHA)
         pygame.draw.circle(self.original_image, RED_ENEMY, (20, 20), 15)
@@ -210,28 +341,37 @@ class Bot(pygame.sprite.Sprite):
         
         self.speed = 2
         self.health = 80
+        self.dot_color = RED_ENEMY
         
         # AI State
         self.weapon = Weapon("Bot AR", 5, 45, 0.15, 1, (50, 50, 50)) # Slower, less damage
         self.state = "WANDER" # WANDER, CHASE, FLEE
         self.target = None
-        self.change_dir_timer = 0
+        self.change_dir_at = 0 # Tick when wandering picks a new direction
+        self.change_dir_ticks = 0 # Wander ticks left, kept while not wandering
         self.wander_dir = pygame.math.Vector2(1, 0)
 
     def update(self, player_pos, storm_radius, walls_group):
-        self.weapon.update()
         old_pos = pygame.math.Vector2(self.pos)
         
         dist_to_player = self.pos.distance_to(player_pos)
         dist_to_center = self.pos.length()
         
         # Storm Logic overrides everything
+        old_state = self.state
         if dist_to_center > storm_radius * 0.9:
             self.state = "FLEE_STORM"
         elif dist_to_player < 600:
             self.state = "CHASE"
         else:
             self.state = "WANDER"
+        if self.state != old_state:
+            recorder.log(telemetry.BOT_STATE, self.pos, target=Bot.STATES.index(self.state), entity=self.id)
+            # The wander timer only runs while wandering
+            if old_state == "WANDER":
+                self.change_dir_ticks = self.change_dir_at - timers.now + 1
+            elif self.state == "WANDER":
+                self.change_dir_at = timers.now + self.change_dir_ticks - 1
             
         if self.state == "FLEE_STORM":
             direction = -self.pos
@@ -249,9 +389,8 @@ class Bot(pygame.sprite.Sprite):
                      return True
                 
         elif self.state == "WANDER":
-            self.change_dir_timer -= 1
-            if self.change_dir_timer <= 0:
-                self.change_dir_timer = random.randint(60, 200)
+            if timers.now >= self.change_dir_at:
+                self.change_dir_at = timers.now + random.randint(60, 200)
                 self.wander_dir = pygame.math.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
                 if self.wander_dir.length() > 0:
                     self.wander_dir = self.wander_dir.normalize()
@@ -279,25 +418,30 @@ class Bot(pygame.sprite.Sprite):
         return False
 
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, pos, direction, damage, from_player, color):
+    def __init__(self, pos, direction, damage, from_player, color, weapon=None):
         super().__init__()
         self.image = pygame.Surface((10, 10), pygame.SRCALPHA)
         pygame.draw.circle(self.image, color, (5, 5), 4)
         self.rect = self.image.get_rect(center=pos)
         
         self.pos = pygame.math.Vector2(pos)
+        self.origin = pygame.math.Vector2(pos)
         self.direction = direction
         self.speed = 20
         self.damage = damage
         self.from_player = from_player
+        self.weapon = weapon
         self.lifetime = 300 
+        self.dot_color = color
+        self.expire_timer = timers.schedule(self.lifetime, self.kill)
+
+    def kill(self):
+        self.expire_timer.cancel()
+        super().kill()
 
     def update(self):
         self.pos += self.direction * self.speed
         self.rect.center = self.pos
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
 
 class Wall(pygame.sprite.Sprite):
     def __init__(self, pos):
@@ -311,6 +455,7 @@ class Wall(pygame.sprite.Sprite):
         
         self.rect = self.image.get_rect(center=pos)
         self.health = 100
+        self.dot_color = BROWN_WOOD
         
     def take_damage(self, amount):
         self.health -= amount
@@ -337,6 +482,7 @@ class Tree(pygame.sprite.Sprite):
         self.pos = (random.uniform(-spawn_range, spawn_range), random.uniform(-spawn_range, spawn_range))
         self.rect.center = self.pos
         self.health = 50
+        self.dot_color = GREEN_DARK
     
     def take_damage(self, amount):
         self.health -= amount
@@ -359,6 +505,7 @@ class Rock(pygame.sprite.Sprite):
         self.pos = (random.uniform(-spawn_range, spawn_range), random.uniform(-spawn_range, spawn_range))
         self.rect.center = self.pos
         self.health = 80
+        self.dot_color = GRAY_STONE
         
     def take_damage(self, amount):
         self.health -= amount
@@ -373,7 +520,8 @@ class Storm:
         self.min_radius = 200
         self.shrink_speed = 0.8
         self.center = (0, 0)
-        self.damage_timer = 0
+        self.damage_at = None # Next damage tick while outside
+        self.damage_ticks = 31 # Ticks outside until the next damage, kept while inside
         
     def update(self):
         if self.radius > self.min_radius:
@@ -381,23 +529,34 @@ class Storm:
             
     def check_damage(self, player):
         dist = player.pos.length()
-        if dist > self.radius:
-             self.damage_timer += 1
-             if self.damage_timer > 30: # 2 ticks per sec approx
-                 player.health -= 2
-                 self.damage_timer = 0
-                 return True
+        if dist <= self.radius:
+            # The countdown only runs outside; keep what is left of it
+            if self.damage_at is not None:
+                self.damage_ticks = self.damage_at - timers.now + 1
+                self.damage_at = None
+            return False
+        if self.damage_at is None:
+            self.damage_at = timers.now + self.damage_ticks - 1
+        if timers.now >= self.damage_at:
+            player.health -= 2
+            self.damage_ticks = 31 # 2 ticks per sec approx
+            self.damage_at = timers.now + self.damage_ticks
+            return True
         return False
         
     def draw(self, surface, camera):
         # Draw huge donut or just the line. Drawing a massive surface is laggy in Pygame.
         # We will draw a clear circle boundary.
         center_screen = camera.apply_pos(self.center)
-        pygame.draw.circle(surface, PURPLE_STORM, (int(center_screen[0]), int(center_screen[1])), int(self.radius), 10)
+        width = max(1, int(10 * camera.zoom))
+        pygame.draw.circle(surface, PURPLE_STORM, (int(center_screen[0]), int(center_screen[1])), int(self.radius * camera.zoom), width)
 
 # === MAIN GAME CLASS ===
 
 def main():
+    timers.reset()
+    recorder.start_match()
+    
     # Groups
     all_sprites = pygame.sprite.Group()
     solids_group = pygame.sprite.Group() # For movement/building collision (Walls, Trees, Rocks, Bots, Player)
@@ -446,12 +605,19 @@ def main():
     victory = False
     
     # Damage Log
-    damage_log = [] # List of (text, timer)
+    damage_log = [] # List of (text, expires)
     
     def add_log(text):
-        damage_log.append([text, 120])
+        entry = (text, timers.now + 120)
+        damage_log.append(entry)
         if len(damage_log) > 5:
             damage_log.pop(0)
+        timers.schedule(120, lambda: expire_log(entry))
+    
+    def expire_log(entry):
+        # Entries may already have been pushed out by newer ones
+        if entry in damage_log:
+            damage_log.remove(entry)
 
     # Line of Sight Check
     def check_line_of_sight(start_pos, end_pos, ignore_group):
@@ -483,12 +649,17 @@ def main():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            
+            # Spectator camera: Tab toggles, mouse wheel zooms
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                camera.toggle_spectate()
+            if event.type == pygame.MOUSEWHEEL and camera.spectating:
+                camera.set_zoom_level(camera.zoom_level - event.y)
                 
             if not game_over:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1: # Left Click: Always Shoot
-                        mx, my = pygame.mouse.get_pos()
-                        world_pos = pygame.math.Vector2(mx - camera.camera.x, my - camera.camera.y)
+                        world_pos = camera.screen_to_world(pygame.mouse.get_pos())
                         player.shoot(world_pos, bullets_group, all_sprites)
                 
                 if event.type == pygame.KEYDOWN:
@@ -504,6 +675,7 @@ def main():
                         if nearest:
                             if nearest.take_damage(25):
                                 player.materials += 15
+                                recorder.log(telemetry.HARVEST, nearest.pos, amount=15)
                                 for _ in range(5):
                                     p = Particle(nearest.rect.center, BROWN_WOOD if isinstance(nearest, Tree) else GRAY_STONE, 8, 30)
                                     all_sprites.add(p)
@@ -511,6 +683,7 @@ def main():
                                 nearest.remove(solids_group)
                             else:
                                 player.materials += 5
+                                recorder.log(telemetry.HARVEST, nearest.pos, amount=5)
                                 add_log(f"Harvesting... (+5 mats)")
                         else:
                             add_log("Nothing nearby to harvest")
@@ -519,9 +692,7 @@ def main():
                     if event.key == pygame.K_q:
                         if player.materials >= 10:
                             # Place wall at mouse cursor position
-                            mx, my = pygame.mouse.get_pos()
-                            world_x = mx - camera.camera.x
-                            world_y = my - camera.camera.y
+                            world_x, world_y = camera.screen_to_world(pygame.mouse.get_pos())
                             
                             grid_x = round(world_x / 50) * 50
                             grid_y = round(world_y / 50) * 50
@@ -542,6 +713,7 @@ def main():
                                 all_sprites.add(wall)
                                 solids_group.add(wall)
                                 player.materials -= 10
+                                recorder.log(telemetry.BUILD, (grid_x, grid_y))
                                 add_log("Wall placed!")
                             else:
                                 add_log("Cannot build here!")
@@ -569,7 +741,8 @@ def main():
             continue
 
         # 2. Update
-        player.update(camera.camera.topleft)
+        timers.advance()
+        player.update(camera)
         particles_group.update()
         
         # Bot Logic
@@ -582,10 +755,13 @@ def main():
                     direction = (player.pos - bot.pos).normalize()
                     # Bot inaccuracy
                     direction = direction.rotate_rad(random.uniform(-0.1, 0.1))
-                    bullet = Bullet(bot.rect.center, direction, 8, False, (255, 100, 100))
+                    bullet = Bullet(bot.rect.center, direction, 8, False, (255, 100, 100), bot.weapon.name)
                     bullets_group.add(bullet)
                     all_sprites.add(bullet)
 
+        if camera.spectating:
+            keys = pygame.key.get_pressed()
+            camera.pan(keys[pygame.K_RIGHT] - keys[pygame.K_LEFT], keys[pygame.K_DOWN] - keys[pygame.K_UP])
         camera.update(player)
         storm.update()
         
@@ -595,6 +771,8 @@ def main():
         for bullet, walls in hits.items():
             for wall in walls:
                 wall.take_damage(bullet.damage)
+                recorder.log(telemetry.HIT, wall.rect.center, bullet.weapon, bullet.damage,
+                             bullet.origin.distance_to(wall.rect.center), telemetry.TARGET_WALL)
                 if wall.health <= 0: wall.remove(solids_group)
                 # Particles
                 p = Particle(bullet.rect.center, BROWN_WOOD, 5, 20)
@@ -605,6 +783,8 @@ def main():
         hits = pygame.sprite.groupcollide(bullets_group, nature_group, True, False)
         for bullet, natures in hits.items():
             for n in natures:
+                recorder.log(telemetry.HIT, n.rect.center, bullet.weapon, bullet.damage,
+                             bullet.origin.distance_to(n.rect.center), telemetry.TARGET_NATURE)
                 if n.take_damage(bullet.damage): # if destroyed
                      if n.health <= 0: n.remove(solids_group)
                 
@@ -612,10 +792,15 @@ def main():
         hits = pygame.sprite.groupcollide(bots_group, bullets_group, False, False)
         for bot, bullets_hit in hits.items():
             for bullet in bullets_hit:
+                if not bot.alive(): # Already killed by an earlier bullet this frame
+                    break
                 if bullet.from_player:
+                    distance = bullet.origin.distance_to(bot.pos)
+                    recorder.log(telemetry.HIT, bot.pos, bullet.weapon, bullet.damage, distance, telemetry.TARGET_BOT, bot.id)
                     if bot.take_damage(bullet.damage):
                         bot.remove(solids_group)
                         player.kills += 1
+                        recorder.log(telemetry.KILL, bot.pos, bullet.weapon, bullet.damage, distance, telemetry.TARGET_BOT, bot.id)
                         add_log(f"Eliminated Bot! ({len(bots_group)} remain)")
                     bullet.kill()
                     # Blood particle
@@ -628,6 +813,8 @@ def main():
         for bullet in hits:
             if not bullet.from_player:
                 player.health -= bullet.damage
+                recorder.log(telemetry.HIT, player.pos, bullet.weapon, bullet.damage,
+                             bullet.origin.distance_to(player.pos), telemetry.TARGET_PLAYER)
                 bullet.kill()
                 # Blood particle
                 p = Particle(player.rect.center, BLUE_PLAYER, 6, 30)
@@ -637,6 +824,7 @@ def main():
 
         # Storm Damage
         if storm.check_damage(player):
+            recorder.log(telemetry.STORM, player.pos, amount=2)
             add_log("Storm Damage!")
 
         # Game Over Conditions
@@ -647,28 +835,37 @@ def main():
         if len(bots_group) == 0:
             game_over = True
             victory = True
+        
+        if game_over:
+            outcome = telemetry.OUTCOME_VICTORY if victory else telemetry.OUTCOME_ELIMINATED
+            recorder.end_match(outcome, player.kills, player.pos)
 
         # 3. Draw
         screen.fill(GREEN_GRASS)
         
         # Draw Background Grid
-        cam_x, cam_y = camera.camera.topleft
         grid_size = 100
-        start_x = -cam_x % grid_size
-        start_y = -cam_y % grid_size
-        
-        for i in range(0, SCREEN_WIDTH + grid_size, grid_size):
-            pygame.draw.line(screen, GREEN_DARK, (start_x + i, 0), (start_x + i, SCREEN_HEIGHT), 1)
-        for i in range(0, SCREEN_HEIGHT + grid_size, grid_size):
-            pygame.draw.line(screen, GREEN_DARK, (0, start_y + i), (SCREEN_WIDTH, start_y + i), 1)
+        while grid_size * camera.zoom < 25: # Coarser grid when zoomed out
+            grid_size *= 2
+        view = camera.world_view()
+        start_x, start_y = camera.apply_pos((math.floor(view.left / grid_size) * grid_size,
+                                             math.floor(view.top / grid_size) * grid_size))
+        step = grid_size * camera.zoom
+        
+        for i in range(int(SCREEN_WIDTH / step) + 2):
+            x = int(start_x + i * step)
+            pygame.draw.line(screen, GREEN_DARK, (x, 0), (x, SCREEN_HEIGHT), 1)
+        for i in range(int(SCREEN_HEIGHT / step) + 2):
+            y = int(start_y + i * step)
+            pygame.draw.line(screen, GREEN_DARK, (0, y), (SCREEN_WIDTH, y), 1)
 
         # Draw Sprites
-        for sprite in walls_group: screen.blit(sprite.image, camera.apply(sprite))
-        for sprite in nature_group: screen.blit(sprite.image, camera.apply(sprite))
-        for sprite in bots_group: screen.blit(sprite.image, camera.apply(sprite))
-        for sprite in players_group: screen.blit(sprite.image, camera.apply(sprite))
-        for sprite in bullets_group: screen.blit(sprite.image, camera.apply(sprite))
-        for sprite in particles_group: screen.blit(sprite.image, camera.apply(sprite))
+        camera.draw(screen, walls_group)
+        camera.draw(screen, nature_group)
+        camera.draw(screen, bots_group)
+        camera.draw(screen, players_group)
+        camera.draw(screen, bullets_group)
+        camera.draw(screen, particles_group)
         
         # Draw Ghost Wall if placing
         # (Simplified: Just draw cursor rect if right click held? Nah, too complex for now, just stick to placement)
@@ -703,24 +900,24 @@ def main():
         
         # Damage Log
         log_y = 160
-        for i, (text, timer) in enumerate(damage_log):
+        for i, (text, expires) in enumerate(damage_log):
              # Fade out OLD logs
-             alpha = min(255, timer * 5)
+             alpha = min(255, (expires - timers.now) * 5)
              log_surf = font_ui.render(text, True, (255, 100, 100))
              log_surf.set_alpha(alpha)
              screen.blit(log_surf, (20, log_y + i * 25))
-             damage_log[i][1] -= 1
-        
-        damage_log = [l for l in damage_log if l[1] > 0]
 
         # Controls Hint
-        hint = font_ui.render("WASD=Move | Click=Shoot | Q=Build | E=Harvest | 1-3=Weapon", True, (200, 200, 200))
+        hint = font_ui.render("WASD=Move | Click=Shoot | Q=Build | E=Harvest | 1-3=Weapon | Tab=Spectate", True, (200, 200, 200))
         screen.blit(hint, (10, SCREEN_HEIGHT - 30))
 
         pygame.display.flip()
         clock.tick(FPS)
 
+    if not game_over:
+        recorder.end_match(telemetry.OUTCOME_QUIT, player.kills, player.pos)
     pygame.quit()
 
 if __name__ == "__main__":
     main()
+    recorder.close()
@@ -0,0 +1,597 @@
+import numpy as np
+
+# Headless, vectorized version of the match in fortnite_2d.py for training bots.
+# Every match instance lives in a row of shared NumPy arrays and all instances
+# are stepped together; no pygame (and no window) is needed.
+#
+#   env = VecEnv(1024, seed=0)
+#   obs = env.reset()
+#   obs, reward, done, info = env.step(move, aim, shoot, build, harvest, weapon)
+#
+# Actions are per-env arrays:
+#   move    (N, 2) float  WASD direction, normalized like Player.get_input
+#   aim     (N, 2) float  cursor offset from the player in world units
+#   shoot   (N,)   bool   left click (fires at player + aim)
+#   build   (N,)   bool   Q (wall snapped to the 50px grid at player + aim)
+#   harvest (N,)   bool   E (nearest tree/rock within 150)
+#   weapon  (N,)   int    1-3 keys as 0..2, -1 keeps the current weapon
+#
+# Finished envs are reset automatically; their last observation is returned in
+# info["final_obs"].
+
+# === SETTINGS (mirrors fortnite_2d.py) ===
+
+SPAWN_RANGE = 1500
+PLAYER_SPEED = 5
+PLAYER_HEALTH = 100
+PLAYER_MATERIALS = 50
+PLAYER_HALF = 20  # 40x40 sprite
+
+BOT_SPEED = 2
+BOT_HEALTH = 80
+BOT_HALF = 20
+BOT_CHASE_RANGE = 600
+BOT_SHOOT_RANGE = 400
+BOT_SHOOT_CHANCE = 0.015
+BOT_BULLET_DAMAGE = 8
+BOT_INACCURACY = 0.1
+
+BULLET_SPEED = 20
+BULLET_LIFETIME = 300
+BULLET_HALF = 5
+
+WALL_HALF = 25
+WALL_HEALTH = 100
+WALL_COST = 10
+GRID_SIZE = 50
+
+TREE_HEALTH = 50
+ROCK_HEALTH = 80
+HARVEST_RANGE = 150
+HARVEST_DAMAGE = 25
+HARVEST_MATS = 5
+HARVEST_DESTROY_MATS = 15
+
+STORM_RADIUS = 2500
+STORM_MIN_RADIUS = 200
+STORM_SHRINK_SPEED = 0.8
+STORM_DAMAGE = 2
+STORM_DAMAGE_INTERVAL = 30
+
+# Pistol, AR, Shotgun: damage, fire_rate, spread, projectile_count
+WEAPON_DAMAGE = np.array([15, 10, 8], dtype=np.float32)
+WEAPON_FIRE_RATE = np.array([20, 8, 60], dtype=np.int32)
+WEAPON_SPREAD = np.array([0.05, 0.1, 0.4], dtype=np.float32)
+WEAPON_COUNT = np.array([1, 1, 5], dtype=np.int32)
+NUM_WEAPONS = len(WEAPON_DAMAGE)
+
+# Rewards
+REWARD_DAMAGE_DEALT = 0.01
+REWARD_DAMAGE_TAKEN = -0.01
+REWARD_KILL = 1.0
+REWARD_VICTORY = 10.0
+REWARD_DEATH = -10.0
+
+# Observation
+OBS_RANGE = 600  # relative positions are divided by this
+OBS_BOTS = 5
+OBS_OBSTACLES = 5
+OBS_BULLETS = 4
+OBS_SIZE = 11 + OBS_BOTS * 5 + OBS_OBSTACLES * 4 + OBS_BULLETS * 5
+
+# Bot AI states (Bot.state)
+WANDER, CHASE, FLEE_STORM = 0, 1, 2
+
+
+def _overlap(a_pos, a_half, b_pos, b_half):
+    # Axis-aligned square overlap, same as Rect.colliderect (strict)
+    d = np.abs(a_pos - b_pos)
+    reach = a_half + b_half
+    return (d[..., 0] < reach) & (d[..., 1] < reach)
+
+
+def _segment_blocked(p0, p1, centers, half, alive):
+    # Slab test of segments p0->p1 against square obstacles (Rect.clipline).
+    # p0/p1: (..., 2), centers: (..., O, 2), half/alive: (..., O)
+    p0 = p0[..., None, :]
+    d = p1[..., None, :] - p0
+    # A tiny direction on a flat axis gives +-huge slab times, which keeps the
+    # segment either always inside or never inside that slab
+    inv = 1 / np.where(d == 0, np.float32(1e-9), d)
+    half = half[..., None]
+    t1 = (centers - half - p0) * inv
+    t2 = (centers + half - p0) * inv
+    tmin = np.minimum(t1, t2)
+    tmax = np.maximum(t1, t2)
+    enter = np.maximum(np.maximum(tmin[..., 0], tmin[..., 1]), 0)
+    leave = np.minimum(np.minimum(tmax[..., 0], tmax[..., 1]), 1)
+    return ((enter <= leave) & alive).any(axis=-1)
+
+
+def _nearest(dist, k):
+    # Indices of the k smallest entries per row, closest first
+    idx = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    order = np.argsort(np.take_along_axis(dist, idx, axis=1), axis=1)
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def _scatter_sum(rows, cols, weights, shape):
+    # Sum weights into a (rows, cols) grid; much faster than np.add.at
+    flat = np.bincount(rows * shape[1] + cols, weights=weights, minlength=shape[0] * shape[1])
+    return flat.reshape(shape).astype(np.float32)
+
+
+def _rotate(vec, angle):
+    c = np.cos(angle)
+    s = np.sin(angle)
+    return np.stack([vec[..., 0] * c - vec[..., 1] * s, vec[..., 0] * s + vec[..., 1] * c], axis=-1)
+
+
+def _normalize(vec):
+    length = np.linalg.norm(vec, axis=-1, keepdims=True)
+    return np.divide(vec, length, out=np.zeros_like(vec), where=length > 0)
+
+
+class VecEnv:
+    def __init__(self, num_envs, num_bots=20, num_trees=50, num_rocks=30,
+                 max_walls=64, max_bullets=64, max_steps=6000, seed=None):
+        self.num_envs = num_envs
+        self.num_bots = num_bots
+        self.num_nature = num_trees + num_rocks
+        self.num_trees = num_trees
+        self.max_walls = max_walls
+        self.max_bullets = max_bullets
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+
+        n, f = num_envs, np.float32
+        # Player
+        self.player_pos = np.zeros((n, 2), f)
+        self.player_health = np.zeros(n, f)
+        self.player_materials = np.zeros(n, np.int32)
+        self.player_kills = np.zeros(n, np.int32)
+        self.weapon_index = np.zeros(n, np.int32)
+        self.weapon_cooldown = np.zeros((n, NUM_WEAPONS), np.int32)
+        # Bots
+        self.bot_pos = np.zeros((n, num_bots, 2), f)
+        self.bot_health = np.zeros((n, num_bots), f)
+        self.bot_alive = np.zeros((n, num_bots), bool)
+        self.bot_state = np.zeros((n, num_bots), np.int8)
+        self.bot_wander_dir = np.zeros((n, num_bots, 2), f)
+        self.bot_change_dir_timer = np.zeros((n, num_bots), np.int32)
+        # Trees then rocks
+        self.nature_pos = np.zeros((n, self.num_nature, 2), f)
+        self.nature_half = np.zeros((n, self.num_nature), f)
+        self.nature_health = np.zeros((n, self.num_nature), f)
+        self.nature_alive = np.zeros((n, self.num_nature), bool)
+        # Walls
+        self.wall_pos = np.zeros((n, max_walls, 2), f)
+        self.wall_health = np.zeros((n, max_walls), f)
+        self.wall_alive = np.zeros((n, max_walls), bool)
+        # Bullets
+        self.bullet_pos = np.zeros((n, max_bullets, 2), f)
+        self.bullet_dir = np.zeros((n, max_bullets, 2), f)
+        self.bullet_damage = np.zeros((n, max_bullets), f)
+        self.bullet_from_player = np.zeros((n, max_bullets), bool)
+        self.bullet_lifetime = np.zeros((n, max_bullets), np.int32)
+        self.bullet_alive = np.zeros((n, max_bullets), bool)
+        # Storm / match
+        self.storm_radius = np.zeros(n, f)
+        self.storm_damage_timer = np.zeros(n, np.int32)
+        self.steps = np.zeros(n, np.int32)
+
+    # === RESET ===
+
+    def reset(self):
+        self._reset_envs(np.arange(self.num_envs))
+        return self.observe()
+
+    def _reset_envs(self, envs):
+        k, rng, f = len(envs), self.rng, np.float32
+        if k == 0:
+            return
+
+        self.player_pos[envs] = 0
+        self.player_health[envs] = PLAYER_HEALTH
+        self.player_materials[envs] = PLAYER_MATERIALS
+        self.player_kills[envs] = 0
+        self.weapon_index[envs] = 0
+        self.weapon_cooldown[envs] = 0
+
+        b = self.num_bots
+        self.bot_pos[envs] = rng.uniform(-SPAWN_RANGE, SPAWN_RANGE, (k, b, 2)).astype(f)
+        self.bot_health[envs] = BOT_HEALTH
+        self.bot_alive[envs] = True
+        self.bot_state[envs] = WANDER
+        self.bot_wander_dir[envs] = (1, 0)
+        self.bot_change_dir_timer[envs] = 0
+
+        t, m = self.num_trees, self.num_nature
+        self.nature_pos[envs] = rng.uniform(-SPAWN_RANGE, SPAWN_RANGE, (k, m, 2)).astype(f)
+        half = np.empty((k, m), f)
+        half[:, :t] = rng.integers(60, 91, (k, t)) / 2
+        half[:, t:] = rng.integers(40, 71, (k, m - t)) / 2
+        self.nature_half[envs] = half
+        self.nature_health[envs, :t] = TREE_HEALTH
+        self.nature_health[envs, t:] = ROCK_HEALTH
+        self.nature_alive[envs] = True
+
+        self.wall_alive[envs] = False
+        self.bullet_alive[envs] = False
+        self.storm_radius[envs] = STORM_RADIUS
+        self.storm_damage_timer[envs] = 0
+        self.steps[envs] = 0
+
+    # === STEP ===
+
+    def step(self, move, aim, shoot, build, harvest, weapon=None):
+        rows = np.arange(self.num_envs)
+        move = np.asarray(move, np.float32)
+        aim = np.asarray(aim, np.float32)
+        shoot = np.asarray(shoot, bool)
+        build = np.asarray(build, bool)
+        harvest = np.asarray(harvest, bool)
+
+        # Dead bots keep their overkill (negative) health, so clip both sides
+        bot_health_before = np.maximum(self.bot_health, 0).sum(axis=1)
+        player_health_before = self.player_health.copy()
+        kills_before = self.player_kills.copy()
+
+        # 1. Player actions (event handling)
+        self._player_shoot(rows, aim, shoot)
+        self._player_harvest(harvest)
+        self._player_build(aim, build)
+
+        # 2. Player update: current weapon cooldown, movement, weapon switch
+        cd = self.weapon_cooldown[rows, self.weapon_index]
+        self.weapon_cooldown[rows, self.weapon_index] = np.maximum(cd - 1, 0)
+        self.player_pos += _normalize(move) * PLAYER_SPEED
+        if weapon is not None:
+            weapon = np.asarray(weapon)
+            switch = (weapon >= 0) & (weapon < NUM_WEAPONS)
+            self.weapon_index[switch] = weapon[switch]
+
+        # 3. Bots, storm, bullets
+        self._update_bots()
+        self.storm_radius = np.where(self.storm_radius > STORM_MIN_RADIUS,
+                                     self.storm_radius - STORM_SHRINK_SPEED, self.storm_radius).astype(np.float32)
+        self._update_bullets()
+
+        # 4. Collisions and storm damage
+        self._collide_bullets()
+        outside = np.linalg.norm(self.player_pos, axis=1) > self.storm_radius
+        self.storm_damage_timer += outside
+        tick = self.storm_damage_timer > STORM_DAMAGE_INTERVAL
+        self.player_health -= tick * STORM_DAMAGE
+        self.storm_damage_timer[tick] = 0
+        self.steps += 1
+
+        # 5. Rewards and episode ends
+        dead = self.player_health <= 0
+        victory = ~dead & ~self.bot_alive.any(axis=1)
+        truncated = ~dead & ~victory & (self.steps >= self.max_steps)
+        done = dead | victory | truncated
+
+        dealt = bot_health_before - np.maximum(self.bot_health, 0).sum(axis=1)
+        taken = player_health_before - self.player_health
+        reward = (REWARD_DAMAGE_DEALT * dealt
+                  + REWARD_DAMAGE_TAKEN * taken
+                  + REWARD_KILL * (self.player_kills - kills_before)
+                  + REWARD_VICTORY * victory
+                  + REWARD_DEATH * dead).astype(np.float32)
+
+        obs = self.observe()
+        info = {"victory": victory, "truncated": truncated, "kills": self.player_kills.copy()}
+        if done.any():
+            info["final_obs"] = obs.copy()
+            envs = np.nonzero(done)[0]
+            self._reset_envs(envs)
+            obs[envs] = self.observe(envs)
+        return obs, reward, done, info
+
+    def _player_shoot(self, rows, aim, shoot):
+        wpn = self.weapon_index
+        ready = self.weapon_cooldown[rows, wpn] <= 0
+        firing = shoot & ready
+        self.weapon_cooldown[firing, wpn[firing]] = WEAPON_FIRE_RATE[wpn[firing]]
+
+        # Player.shoot only spawns bullets for a non-zero aim direction
+        firing &= np.any(aim != 0, axis=1)
+        envs = np.repeat(np.nonzero(firing)[0], WEAPON_COUNT[wpn[firing]])
+        if len(envs) == 0:
+            return
+        w = wpn[envs]
+        spread = self.rng.uniform(-1, 1, len(envs)).astype(np.float32) * WEAPON_SPREAD[w]
+        direction = _rotate(_normalize(aim[envs]), spread)
+        self._spawn_bullets(envs, self.player_pos[envs], direction, WEAPON_DAMAGE[w], True)
+
+    def _player_harvest(self, harvest):
+        envs = np.nonzero(harvest)[0]
+        if len(envs) == 0:
+            return
+        dist = np.linalg.norm(self.nature_pos[envs] - self.player_pos[envs, None], axis=2)
+        dist[~self.nature_alive[envs]] = np.inf
+        nearest = dist.argmin(axis=1)
+        found = dist[np.arange(len(envs)), nearest] < HARVEST_RANGE
+        envs, nearest = envs[found], nearest[found]
+
+        self.nature_health[envs, nearest] -= HARVEST_DAMAGE
+        destroyed = self.nature_health[envs, nearest] <= 0
+        self.nature_alive[envs, nearest] &= ~destroyed
+        self.player_materials[envs] += np.where(destroyed, HARVEST_DESTROY_MATS, HARVEST_MATS)
+
+    def _player_build(self, aim, build):
+        envs = np.nonzero(build & (self.player_materials >= WALL_COST))[0]
+        if len(envs) == 0:
+            return
+        spot = (np.round((self.player_pos[envs] + aim[envs]) / GRID_SIZE) * GRID_SIZE)[:, None]
+
+        # Valid placement: no overlap with any solid (bots, nature, walls, player)
+        blocked = _overlap(spot, WALL_HALF, self.bot_pos[envs], BOT_HALF) & self.bot_alive[envs]
+        collides = blocked.any(axis=1)
+        blocked = _overlap(spot, WALL_HALF, self.nature_pos[envs], self.nature_half[envs]) & self.nature_alive[envs]
+        collides |= blocked.any(axis=1)
+        blocked = _overlap(spot, WALL_HALF, self.wall_pos[envs], WALL_HALF) & self.wall_alive[envs]
+        collides |= blocked.any(axis=1)
+        collides |= _overlap(spot[:, 0], WALL_HALF, self.player_pos[envs], PLAYER_HALF)
+
+        free = ~self.wall_alive[envs]
+        slot = free.argmax(axis=1)
+        ok = ~collides & free[np.arange(len(envs)), slot]
+        envs, slot = envs[ok], slot[ok]
+        self.wall_pos[envs, slot] = spot[ok, 0]
+        self.wall_health[envs, slot] = WALL_HEALTH
+        self.wall_alive[envs, slot] = True
+        self.player_materials[envs] -= WALL_COST
+
+    def _update_bots(self):
+        alive = self.bot_alive
+        old_pos = self.bot_pos.copy()
+        to_player = self.player_pos[:, None] - self.bot_pos
+        dist_to_player = np.linalg.norm(to_player, axis=2)
+        dist_to_center = np.linalg.norm(self.bot_pos, axis=2)
+
+        # Storm logic overrides everything
+        state = np.where(dist_to_center > self.storm_radius[:, None] * 0.9, FLEE_STORM,
+                         np.where(dist_to_player < BOT_CHASE_RANGE, CHASE, WANDER)).astype(np.int8)
+        self.bot_state = state
+        flee = alive & (state == FLEE_STORM)
+        chase = alive & (state == CHASE)
+        wander = alive & (state == WANDER)
+
+        # Wander: pick a new direction when the timer runs out
+        self.bot_change_dir_timer -= wander
+        new_dir = wander & (self.bot_change_dir_timer <= 0)
+        count = int(new_dir.sum())
+        if count:
+            self.bot_change_dir_timer[new_dir] = self.rng.integers(60, 201, count)
+            self.bot_wander_dir[new_dir] = _normalize(self.rng.uniform(-1, 1, (count, 2)).astype(np.float32))
+
+        velocity = (flee[..., None] * _normalize(-self.bot_pos) * BOT_SPEED
+                    + chase[..., None] * _normalize(to_player) * (BOT_SPEED * 0.7)
+                    + wander[..., None] * self.bot_wander_dir * (BOT_SPEED * 0.5))
+        self.bot_pos += velocity
+
+        # Wall collision: push back to old position and reverse wander
+        w = self._walls_in_use()
+        if w:
+            hit = (_overlap(self.bot_pos[:, :, None], BOT_HALF, self.wall_pos[:, None, :w], WALL_HALF)
+                   & self.wall_alive[:, None, :w]).any(axis=2) & alive
+            self.bot_pos[hit] = old_pos[hit]
+            self.bot_wander_dir[hit] = -self.bot_wander_dir[hit]
+
+        # Shooting: random chance within range, then a line of sight check
+        want = chase & (dist_to_player < BOT_SHOOT_RANGE)
+        want &= self.rng.random(want.shape, dtype=np.float32) < BOT_SHOOT_CHANCE
+        envs, bots = np.nonzero(want)
+        if len(envs) == 0:
+            return
+        centers, half, obstacle_alive = self._obstacles(envs)
+        clear = ~_segment_blocked(self.bot_pos[envs, bots], self.player_pos[envs], centers, half, obstacle_alive)
+        envs, bots = envs[clear], bots[clear]
+        if len(envs) == 0:
+            return
+        direction = _normalize(self.player_pos[envs] - self.bot_pos[envs, bots])
+        direction = _rotate(direction, self.rng.uniform(-BOT_INACCURACY, BOT_INACCURACY, len(envs)).astype(np.float32))
+        damage = np.full(len(envs), BOT_BULLET_DAMAGE, np.float32)
+        self._spawn_bullets(envs, self.bot_pos[envs, bots], direction, damage, False)
+
+    def _obstacles(self, envs):
+        # Nature and walls together, for line of sight checks
+        w = self._walls_in_use()
+        centers = np.concatenate([self.nature_pos[envs], self.wall_pos[envs, :w]], axis=1)
+        half = np.concatenate([self.nature_half[envs], np.full((len(envs), w), WALL_HALF, np.float32)], axis=1)
+        alive = np.concatenate([self.nature_alive[envs], self.wall_alive[envs, :w]], axis=1)
+        return centers, half, alive
+
+    def _spawn_bullets(self, envs, pos, direction, damage, from_player):
+        # Several requests may target the same env: the r-th request for an
+        # env takes its r-th free slot (dropped if the env is out of slots).
+        order = np.argsort(envs, kind="stable")
+        envs, pos, direction, damage = envs[order], pos[order], direction[order], damage[order]
+        rank = np.arange(len(envs)) - np.searchsorted(envs, envs)
+
+        free = ~self.bullet_alive[envs]
+        free_rank = np.cumsum(free, axis=1) - 1
+        match = free & (free_rank == rank[:, None])
+        slot = match.argmax(axis=1)
+        ok = match[np.arange(len(envs)), slot]
+        envs, slot = envs[ok], slot[ok]
+
+        self.bullet_pos[envs, slot] = pos[ok]
+        self.bullet_dir[envs, slot] = direction[ok]
+        self.bullet_damage[envs, slot] = damage[ok]
+        self.bullet_from_player[envs, slot] = from_player
+        self.bullet_lifetime[envs, slot] = BULLET_LIFETIME
+        self.bullet_alive[envs, slot] = True
+
+    def _update_bullets(self):
+        alive = self.bullet_alive
+        self.bullet_pos += self.bullet_dir * (BULLET_SPEED * alive[..., None])
+        self.bullet_lifetime -= alive
+        self.bullet_alive &= self.bullet_lifetime > 0
+
+    def _walls_in_use(self):
+        # Walls fill the lowest free slot, so only the first columns matter
+        used = np.nonzero(self.wall_alive.any(axis=0))[0]
+        return used[-1] + 1 if len(used) else 0
+
+    def _collide_bullets(self):
+        # Only live bullets are tested, each against its own env's entities
+        envs, slots = np.nonzero(self.bullet_alive)
+        if len(envs) == 0:
+            return
+        pos = self.bullet_pos[envs, slots]
+        damage = self.bullet_damage[envs, slots]
+        live = np.ones(len(envs), bool)
+
+        # Bullets hit Walls
+        w = self._walls_in_use()
+        if w:
+            hits = (_overlap(pos[:, None], BULLET_HALF, self.wall_pos[envs, :w], WALL_HALF)
+                    & self.wall_alive[envs, :w])
+            rows, cols = np.nonzero(hits)
+            self.wall_health -= _scatter_sum(envs[rows], cols, damage[rows], self.wall_health.shape)
+            self.wall_alive &= self.wall_health > 0
+            live[rows] = False
+
+        # Bullets hit Nature (only bullets still over the spawn area can)
+        reach = SPAWN_RANGE + self.nature_half.max() + BULLET_HALF
+        near = np.nonzero(live & (np.abs(pos) < reach).all(axis=1))[0]
+        if len(near):
+            hits = (_overlap(pos[near, None], BULLET_HALF, self.nature_pos[envs[near]], self.nature_half[envs[near]])
+                    & self.nature_alive[envs[near]])
+            rows, cols = np.nonzero(hits)
+            rows = near[rows]
+            self.nature_health -= _scatter_sum(envs[rows], cols, damage[rows], self.nature_health.shape)
+            self.nature_alive &= self.nature_health > 0
+            live[rows] = False
+
+        # Bullets hit Bots (player bullets only)
+        from_player = self.bullet_from_player[envs, slots]
+        shots = np.nonzero(live & from_player)[0]
+        if len(shots):
+            hits = (_overlap(pos[shots, None], BULLET_HALF, self.bot_pos[envs[shots]], BOT_HALF)
+                    & self.bot_alive[envs[shots]])
+            rows, cols = np.nonzero(hits)
+            rows = shots[rows]
+            self.bot_health -= _scatter_sum(envs[rows], cols, damage[rows], self.bot_health.shape)
+            killed = self.bot_alive & (self.bot_health <= 0)
+            self.bot_alive &= ~killed
+            self.player_kills += killed.sum(axis=1, dtype=np.int32)
+            live[rows] = False
+
+        # Bullets hit Player (bot bullets only)
+        hits = live & ~from_player & _overlap(pos, BULLET_HALF, self.player_pos[envs], PLAYER_HALF)
+        self.player_health -= np.bincount(envs[hits], weights=damage[hits], minlength=self.num_envs).astype(np.float32)
+        live &= ~hits
+
+        self.bullet_alive[envs, slots] = live
+
+    # === OBSERVATION ===
+
+    def observe(self, envs=None):
+        # Observations for all envs, or only the given ones (after a reset)
+        if envs is None:
+            envs = np.arange(self.num_envs)
+        n, rows = len(envs), np.arange(len(envs))
+        pos = self.player_pos[envs]
+        weapon = self.weapon_index[envs]
+        storm_radius = self.storm_radius[envs]
+        bot_alive = self.bot_alive[envs]
+        obs = np.zeros((n, OBS_SIZE), np.float32)
+
+        # Self: health, materials, weapon, readiness, storm
+        dist_to_center = np.linalg.norm(pos, axis=1)
+        obs[:, 0] = self.player_health[envs] / PLAYER_HEALTH
+        obs[:, 1] = self.player_materials[envs] / 100
+        obs[rows, 2 + weapon] = 1
+        obs[:, 5] = self.weapon_cooldown[envs, weapon] <= 0
+        obs[:, 6:8] = pos / STORM_RADIUS
+        obs[:, 8] = storm_radius / STORM_RADIUS
+        obs[:, 9] = dist_to_center / storm_radius
+        obs[:, 10] = bot_alive.mean(axis=1)
+        col = 11
+
+        centers, half, alive = self._obstacles(envs)
+        obstacle_rel = centers - pos[:, None]
+        obstacle_dist = np.where(alive, np.linalg.norm(obstacle_rel, axis=2), np.inf)
+
+        # Nearest bots: relative position, health, line of sight
+        k = min(OBS_BOTS, self.num_bots)
+        bot_pos = self.bot_pos[envs]
+        rel = bot_pos - pos[:, None]
+        dist = np.where(bot_alive, np.linalg.norm(rel, axis=2), np.inf)
+        idx = _nearest(dist, k)
+        present = np.isfinite(np.take_along_axis(dist, idx, axis=1))
+        targets = np.take_along_axis(bot_pos, idx[..., None], axis=1)
+        # Only obstacles overlapping a segment's bounding box can block it
+        low = np.minimum(pos[:, None], targets)[:, :, None]
+        high = np.maximum(pos[:, None], targets)[:, :, None]
+        box_low = (centers - half[..., None])[:, None]
+        box_high = (centers + half[..., None])[:, None]
+        candidate = ((box_high[..., 0] >= low[..., 0]) & (box_low[..., 0] <= high[..., 0])
+                     & (box_high[..., 1] >= low[..., 1]) & (box_low[..., 1] <= high[..., 1])
+                     & alive[:, None] & present[..., None])
+        seg_env, seg_bot, near = np.nonzero(candidate)
+        blocked = _segment_blocked(pos[seg_env], targets[seg_env, seg_bot], centers[seg_env, near][:, None],
+                                   half[seg_env, near][:, None], np.ones((len(seg_env), 1), bool))
+        blocked_count = _scatter_sum(seg_env, seg_bot, blocked, (n, k))
+        block = np.zeros((n, OBS_BOTS, 5), np.float32)
+        block[:, :k, :2] = np.take_along_axis(rel, idx[..., None], axis=1) / OBS_RANGE
+        block[:, :k, 2] = np.take_along_axis(self.bot_health[envs], idx, axis=1) / BOT_HEALTH
+        block[:, :k, 3] = blocked_count == 0
+        block[:, :k, 4] = 1
+        block[:, :k] *= present[..., None]
+        obs[:, col:col + OBS_BOTS * 5] = block.reshape(n, -1)
+        col += OBS_BOTS * 5
+
+        # Nearest obstacles (trees, rocks, walls): relative position, size
+        k = min(OBS_OBSTACLES, centers.shape[1])
+        idx = _nearest(obstacle_dist, k)
+        present = np.isfinite(np.take_along_axis(obstacle_dist, idx, axis=1))
+        block = np.zeros((n, OBS_OBSTACLES, 4), np.float32)
+        block[:, :k, :2] = np.take_along_axis(obstacle_rel, idx[..., None], axis=1) / OBS_RANGE
+        block[:, :k, 2] = np.take_along_axis(half, idx, axis=1) / GRID_SIZE
+        block[:, :k, 3] = 1
+        block[:, :k] *= present[..., None]
+        obs[:, col:col + OBS_OBSTACLES * 4] = block.reshape(n, -1)
+        col += OBS_OBSTACLES * 4
+
+        # Nearest incoming bullets: relative position, direction
+        k = min(OBS_BULLETS, self.max_bullets)
+        rel = self.bullet_pos[envs] - pos[:, None]
+        enemy = self.bullet_alive[envs] & ~self.bullet_from_player[envs]
+        dist = np.where(enemy, np.linalg.norm(rel, axis=2), np.inf)
+        idx = _nearest(dist, k)
+        present = np.isfinite(np.take_along_axis(dist, idx, axis=1))
+        block = np.zeros((n, OBS_BULLETS, 5), np.float32)
+        block[:, :k, :2] = np.take_along_axis(rel, idx[..., None], axis=1) / OBS_RANGE
+        block[:, :k, 2:4] = np.take_along_axis(self.bullet_dir[envs], idx[..., None], axis=1)
+        block[:, :k, 4] = 1
+        block[:, :k] *= present[..., None]
+        obs[:, col:col + OBS_BULLETS * 5] = block.reshape(n, -1)
+
+        return obs
+
+if __name__ == "__main__":
+    # Throughput check with random actions, timed once episodes are under way
+    import time
+
+    env = VecEnv(1024, seed=0)
+    env.reset()
+    rng = np.random.default_rng(1)
+
+    def run(steps):
+        for _ in range(steps):
+            n = env.num_envs
+            env.step(rng.uniform(-1, 1, (n, 2)), rng.uniform(-300, 300, (n, 2)),
+                     rng.random(n) < 0.5, rng.random(n) < 0.02, rng.random(n) < 0.05,
+                     rng.integers(-1, NUM_WEAPONS, n))
+
+    run(600) # Past the start: walls, bullets and finished episodes build up
+    steps = 200
+    start = time.perf_counter()
+    run(steps)
+    elapsed = time.perf_counter() - start
+    print(f"{steps * env.num_envs / elapsed:,.0f} env steps/sec")
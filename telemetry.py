@@ -0,0 +1,279 @@
+import argparse
+import glob
+import os
+import queue
+import threading
+import time
+import uuid
+
+import numpy as np
+
+# Match telemetry for fortnite_2d.py.
+#
+# The game appends typed events to an in-memory list (one tuple per event).
+# Full chunks are handed to a background thread, which turns them into
+# columns and writes one compressed .npz file per chunk:
+#
+#   <dir>/<match id>-<chunk>.npz
+#
+# `python telemetry.py DIR...` streams through those files one at a time and
+# prints heatmaps, weapon stats/TTK and a survival curve.
+
+# === EVENTS ===
+
+BUILD, HARVEST, HIT, KILL, STORM, BOT_STATE, MATCH_END = range(7)
+EVENT_NAMES = ("build", "harvest", "hit", "kill", "storm", "bot_state", "match_end")
+
+# Hit/kill targets
+TARGET_WALL, TARGET_NATURE, TARGET_BOT, TARGET_PLAYER = range(4)
+TARGET_NAMES = ("wall", "nature", "bot", "player")
+
+# Match outcomes (MATCH_END amount)
+OUTCOME_ELIMINATED, OUTCOME_VICTORY, OUTCOME_QUIT = range(3)
+
+# Column layout of every event:
+#   tick      game tick
+#   event     event type above
+#   x, y      where it happened (target position for hits)
+#   weapon    index into the chunk's weapon names, -1 if none
+#   amount    damage, harvest yield, or match outcome
+#   distance  shot origin to target centre for hits and kills
+#   target    target type for hits/kills, new state for bot_state, kills for match_end
+#   entity    bot id for bot hits/kills/state changes, -1 otherwise
+EVENT_DTYPE = np.dtype([
+    ("tick", np.int32),
+    ("event", np.uint8),
+    ("x", np.float32),
+    ("y", np.float32),
+    ("weapon", np.int16),
+    ("amount", np.float32),
+    ("distance", np.float32),
+    ("target", np.int16),
+    ("entity", np.int32),
+])
+
+CHUNK_SIZE = 4096
+
+
+class Telemetry:
+    def __init__(self, directory, clock):
+        self.directory = directory
+        self.clock = clock # Returns the current game tick
+        self.enabled = directory is not None
+        self.events = []
+        self.weapon_ids = {}
+        self.match_id = None
+        self.chunk = 0
+        self.queue = queue.Queue()
+        self.writer = None
+
+    def start_match(self):
+        if not self.enabled:
+            return
+        if self.writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.writer = threading.Thread(target=self._write_loop, daemon=True)
+            self.writer.start()
+        self.flush()
+        self.match_id = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:8]
+        self.chunk = 0
+
+    def end_match(self, outcome, kills, pos):
+        self.log(MATCH_END, pos, amount=outcome, target=kills)
+        self.flush()
+
+    def log(self, event, pos, weapon=None, amount=0, distance=0, target=-1, entity=-1):
+        if not self.enabled:
+            return
+        weapon_id = -1
+        if weapon is not None:
+            weapon_id = self.weapon_ids.setdefault(weapon, len(self.weapon_ids))
+        self.events.append((self.clock(), event, pos[0], pos[1], weapon_id, amount, distance, target, entity))
+        if len(self.events) >= CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        # Hand the buffer over; the writer thread does all the heavy work
+        if not self.events:
+            return
+        path = os.path.join(self.directory, f"{self.match_id}-{self.chunk:04d}.npz")
+        self.queue.put((path, self.events, list(self.weapon_ids)))
+        self.events = []
+        self.chunk += 1
+
+    def close(self):
+        if self.writer is None:
+            return
+        self.flush()
+        self.queue.put(None)
+        self.writer.join()
+        self.writer = None
+
+    def _write_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            path, events, weapons = item
+            table = np.array(events, dtype=EVENT_DTYPE)
+            columns = {name: table[name] for name in EVENT_DTYPE.names}
+            # Write under a temp name so readers never see half a file
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, weapon_names=np.array(weapons, dtype=str), **columns)
+            os.replace(tmp, path)
+
+
+# === AGGREGATION ===
+
+def iter_chunks(paths):
+    # Yields (match id, columns, weapon names) one file at a time, in order
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, "*.npz")))
+        else:
+            files.append(path)
+    for file in sorted(files):
+        match_id = os.path.basename(file).rsplit("-", 1)[0]
+        with np.load(file) as data:
+            columns = {name: data[name] for name in EVENT_DTYPE.names}
+            yield match_id, columns, list(data["weapon_names"])
+
+
+class Summary:
+    def __init__(self, extent=2500, cell=250):
+        self.extent = extent
+        bins = int(2 * extent / cell)
+        self.edges = np.linspace(-extent, extent, bins + 1)
+        self.heatmaps = {name: np.zeros((bins, bins), np.int64) for name in ("build", "kill", "hit_taken", "storm")}
+        self.event_counts = np.zeros(len(EVENT_NAMES), np.int64)
+        self.harvest_total = 0.0
+        self.harvest_count = 0
+        # Per weapon name: hits, damage, distance sum, kills, TTK samples
+        self.weapons = {}
+        self.first_hit = {} # Bot id -> tick of its first hit, in the current match
+        self.match = None
+        self.durations = []
+        self.outcomes = []
+
+    def weapon(self, name):
+        return self.weapons.setdefault(name, {"hits": 0, "damage": 0.0, "distance": 0.0, "kills": 0, "ttk": []})
+
+    def add_heatmap(self, name, columns, mask):
+        counts, _, _ = np.histogram2d(columns["y"][mask], columns["x"][mask], bins=(self.edges, self.edges))
+        self.heatmaps[name] += counts.astype(np.int64)
+
+    def add(self, match_id, columns, weapon_names):
+        if match_id != self.match:
+            self.match = match_id
+            self.first_hit = {}
+        event, target = columns["event"], columns["target"]
+        self.event_counts += np.bincount(event, minlength=len(EVENT_NAMES))[:len(EVENT_NAMES)]
+
+        self.add_heatmap("build", columns, event == BUILD)
+        self.add_heatmap("kill", columns, event == KILL)
+        self.add_heatmap("hit_taken", columns, (event == HIT) & (target == TARGET_PLAYER))
+        self.add_heatmap("storm", columns, event == STORM)
+
+        harvest = event == HARVEST
+        self.harvest_total += float(columns["amount"][harvest].sum())
+        self.harvest_count += int(harvest.sum())
+
+        # Hits per weapon
+        hits = event == HIT
+        weapon = columns["weapon"]
+        for index, name in enumerate(weapon_names):
+            mine = hits & (weapon == index)
+            stats = self.weapon(name)
+            stats["hits"] += int(mine.sum())
+            stats["damage"] += float(columns["amount"][mine].sum())
+            stats["distance"] += float(columns["distance"][mine].sum())
+
+        # Time to kill: first hit on a bot until its kill
+        tick, entity = columns["tick"], columns["entity"]
+        for i in np.nonzero((hits & (target == TARGET_BOT)) | (event == KILL))[0]:
+            bot = int(entity[i])
+            if event[i] == HIT:
+                self.first_hit.setdefault(bot, int(tick[i]))
+            else:
+                stats = self.weapon(weapon_names[weapon[i]] if weapon[i] >= 0 else "unknown")
+                stats["kills"] += 1
+                stats["ttk"].append(int(tick[i]) - self.first_hit.pop(bot, int(tick[i])))
+
+        for i in np.nonzero(event == MATCH_END)[0]:
+            self.durations.append(int(tick[i]))
+            self.outcomes.append(int(columns["amount"][i]))
+
+    def survival_curve(self, step):
+        # Kaplan-Meier: victories and quits are censored, eliminations are deaths
+        durations = np.array(self.durations)
+        died = np.array(self.outcomes) == OUTCOME_ELIMINATED
+        curve = []
+        alive = 1.0
+        for t in np.unique(durations[died]):
+            at_risk = (durations >= t).sum()
+            alive *= 1 - (died & (durations == t)).sum() / at_risk
+            curve.append((t, alive))
+        points = []
+        for t in range(0, int(durations.max()) + step, step):
+            s = 1.0
+            for death_tick, value in curve:
+                if death_tick <= t:
+                    s = value
+            points.append((t, s))
+        return points
+
+    def report(self, fps=60):
+        lines = [f"Matches: {len(self.durations)}"]
+        lines.append("Events: " + ", ".join(f"{n}={c}" for n, c in zip(EVENT_NAMES, self.event_counts)))
+        if self.harvest_count:
+            lines.append(f"Harvest: {self.harvest_count} swings, {self.harvest_total:.0f} mats "
+                         f"({self.harvest_total / self.harvest_count:.1f} per swing)")
+
+        lines.append("")
+        lines.append(f"{'Weapon':<16}{'Hits':>8}{'Damage':>10}{'Avg dist':>10}{'Kills':>7}{'TTK med (s)':>13}")
+        for name, stats in sorted(self.weapons.items()):
+            dist = stats["distance"] / stats["hits"] if stats["hits"] else 0
+            ttk = f"{np.median(stats['ttk']) / fps:.2f}" if stats["ttk"] else "-"
+            lines.append(f"{name:<16}{stats['hits']:>8}{stats['damage']:>10.0f}{dist:>10.0f}{stats['kills']:>7}{ttk:>13}")
+
+        if self.durations:
+            outcomes = np.bincount(self.outcomes, minlength=3)
+            lines.append("")
+            lines.append(f"Outcomes: {outcomes[OUTCOME_VICTORY]} victories, "
+                         f"{outcomes[OUTCOME_ELIMINATED]} eliminations, {outcomes[OUTCOME_QUIT]} quit")
+            lines.append("Player survival:")
+            for t, s in self.survival_curve(step=10 * fps):
+                lines.append(f"  {t / fps:5.0f}s {s:6.1%} " + "#" * int(s * 40))
+
+        shades = " .:-=+*#%@"
+        for name, grid in self.heatmaps.items():
+            if not grid.any():
+                continue
+            lines.append("")
+            lines.append(f"Heatmap: {name} ({grid.sum()} events, {2 * self.extent}x{2 * self.extent} world)")
+            scaled = np.ceil(grid / grid.max() * (len(shades) - 1)).astype(int)
+            for row in scaled:
+                lines.append("  " + "".join(shades[v] * 2 for v in row))
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize Fortnite 2D match telemetry")
+    parser.add_argument("paths", nargs="+", help="telemetry directories or .npz files")
+    parser.add_argument("--cell", type=int, default=250, help="heatmap cell size in world units")
+    parser.add_argument("--extent", type=int, default=2500, help="heatmap half-width in world units")
+    args = parser.parse_args()
+    for path in args.paths:
+        if not os.path.exists(path):
+            parser.error(f"no such file or directory: {path}")
+
+    summary = Summary(extent=args.extent, cell=args.cell)
+    for match_id, columns, weapon_names in iter_chunks(args.paths):
+        summary.add(match_id, columns, weapon_names)
+    print(summary.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import numpy as np
+
+from fortnite_env import VecEnv, REWARD_DAMAGE_DEALT, REWARD_KILL
+
+
+def test_overkill_does_not_cost_reward_later():
+    env = VecEnv(1, num_bots=2, seed=0)
+    env.reset()
+    env.nature_alive[:] = False
+    # A bot at 5 HP next to the player, the other one far away
+    env.bot_pos[0] = ((20, 0), (2000, 2000))
+    env.bot_health[0, 0] = 5
+
+    zeros = np.zeros((1, 2))
+    no = np.zeros(1, bool)
+    _, reward, done, _ = env.step(zeros, np.array([[100.0, 0.0]]), np.ones(1, bool), no, no)
+    assert not done[0]
+    assert env.bot_health[0, 0] < 0  # 15 damage pistol shot
+    assert np.isclose(reward[0], REWARD_KILL + 5 * REWARD_DAMAGE_DEALT)
+
+    for _ in range(20):
+        _, reward, _, _ = env.step(zeros, zeros, no, no, no)
+        assert reward[0] == 0
+
+
+def test_line_of_sight_blocked_by_obstacle_corner():
+    env = VecEnv(1, num_bots=1, num_trees=1, num_rocks=0, seed=0)
+    env.reset()
+    env.bot_pos[0, 0] = (300, 0)
+    # Only the tree's corner reaches the far end of the segment
+    env.nature_pos[0, 0] = (339, 39)
+    env.nature_half[0, 0] = 40
+
+    obs = env.observe()
+    assert obs[0, 15] == 1  # Bot present
+    assert obs[0, 14] == 0  # No line of sight
@@ -0,0 +1,83 @@
+import numpy as np
+
+import telemetry
+from telemetry import Telemetry, Summary, iter_chunks, EVENT_DTYPE
+
+
+def columns(*events):
+    # (tick, event, x, y, weapon, amount, distance, target, entity) tuples
+    table = np.array(list(events), dtype=EVENT_DTYPE)
+    return {name: table[name] for name in EVENT_DTYPE.names}
+
+
+def test_writer_round_trip(tmp_path):
+    tick = [0]
+    recorder = Telemetry(str(tmp_path), lambda: tick[0])
+    recorder.start_match()
+    recorder.log(telemetry.BUILD, (100, -50))
+    tick[0] = 7
+    recorder.log(telemetry.HIT, (3.5, 4.5), "Shotgun", 12, 250.0, telemetry.TARGET_BOT, 4)
+    tick[0] = 9
+    recorder.end_match(telemetry.OUTCOME_VICTORY, 3, (1, 2))
+    recorder.close()
+
+    chunks = list(iter_chunks([str(tmp_path)]))
+    assert len(chunks) == 1
+    match_id, cols, weapon_names = chunks[0]
+    assert match_id == recorder.match_id
+    assert weapon_names == ["Shotgun"]
+    assert list(cols["tick"]) == [0, 7, 9]
+    assert list(cols["event"]) == [telemetry.BUILD, telemetry.HIT, telemetry.MATCH_END]
+    assert list(cols["x"]) == [100, 3.5, 1] and list(cols["y"]) == [-50, 4.5, 2]
+    assert list(cols["weapon"]) == [-1, 0, -1]
+    assert cols["distance"][1] == 250
+    assert cols["entity"][1] == 4
+    assert cols["amount"][2] == telemetry.OUTCOME_VICTORY and cols["target"][2] == 3
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_time_to_kill_spans_chunks_of_one_match():
+    hit, kill, bot = telemetry.HIT, telemetry.KILL, telemetry.TARGET_BOT
+    summary = Summary()
+    summary.add("match-a", columns((100, hit, 0, 0, 0, 10, 50, bot, 1),
+                                   (130, hit, 0, 0, 0, 10, 50, bot, 1)), ["AR"])
+    # Weapon ids are per chunk: the AR has id 1 here
+    summary.add("match-a", columns((160, kill, 0, 0, 1, 10, 50, bot, 1)), ["Pistol", "AR"])
+    # Same bot id in a new match starts over
+    summary.add("match-b", columns((500, kill, 0, 0, 0, 10, 50, bot, 1)), ["AR"])
+
+    stats = summary.weapons["AR"]
+    assert stats["hits"] == 2 and stats["kills"] == 2
+    assert stats["ttk"] == [60, 0]
+
+
+def test_survival_censors_victories_and_quits():
+    end = telemetry.MATCH_END
+    summary = Summary()
+    outcomes = [(100, telemetry.OUTCOME_ELIMINATED), (200, telemetry.OUTCOME_VICTORY),
+                (300, telemetry.OUTCOME_ELIMINATED), (400, telemetry.OUTCOME_QUIT)]
+    for i, (tick, outcome) in enumerate(outcomes):
+        summary.add(f"match-{i}", columns((tick, end, 0, 0, -1, outcome, 0, 0, -1)), [])
+
+    # 4 at risk at 100 (3/4 survive), 2 at risk at 300 (1/2 survive)
+    points = summary.survival_curve(step=100)
+    assert [t for t, _ in points] == [0, 100, 200, 300, 400]
+    assert np.allclose([s for _, s in points], [1, 0.75, 0.75, 0.375, 0.375])
+
+
+def test_heatmap_binning():
+    build = telemetry.BUILD
+    summary = Summary(extent=100, cell=50)
+    summary.add("match", columns((0, build, -75, -75, -1, 0, 0, -1, -1),
+                                 (0, build, 60, -10, -1, 0, 0, -1, -1),
+                                 (0, build, 60, -20, -1, 0, 0, -1, -1),
+                                 (0, build, 99, 99, -1, 0, 0, -1, -1),
+                                 (0, build, 500, 0, -1, 0, 0, -1, -1),  # Outside the extent
+                                 (0, telemetry.HARVEST, 0, 0, -1, 15, 0, -1, -1)), [])
+
+    expected = np.zeros((4, 4), np.int64)
+    expected[0, 0] = 1  # Rows are y, columns are x
+    expected[1, 3] = 2
+    expected[3, 3] = 1
+    assert np.array_equal(summary.heatmaps["build"], expected)
+    assert not summary.heatmaps["kill"].any()
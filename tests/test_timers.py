@@ -0,0 +1,68 @@
+import pytest
+
+from timer_wheel import TimerWheel
+
+
+def run_until_fired(wheel, delay, start=0):
+    for _ in range(start):
+        wheel.advance()
+    fired = []
+    wheel.schedule(delay, lambda: fired.append(wheel.now))
+    scheduled_at = wheel.now
+    while not fired and wheel.now < scheduled_at + delay + 1:
+        wheel.advance()
+    return fired, scheduled_at
+
+
+@pytest.mark.parametrize("delay", [1, 63, 64, 4095, 4096, 64 ** 3 + 5000])
+def test_fires_after_exact_delay(delay):
+    wheel = TimerWheel()
+    fired, scheduled_at = run_until_fired(wheel, delay)
+    assert fired == [scheduled_at + delay]
+
+
+@pytest.mark.parametrize("delay", [1, 63, 64, 4095, 4096, 64 ** 3 + 5000])
+def test_fires_after_exact_delay_when_scheduled_mid_lap(delay):
+    # Start part-way through a level-0 lap and a level-1 lap
+    wheel = TimerWheel()
+    fired, scheduled_at = run_until_fired(wheel, delay, start=64 * 5 + 37)
+    assert fired == [scheduled_at + delay]
+
+
+def test_timers_fire_once_in_expiry_order():
+    wheel = TimerWheel()
+    for _ in range(50):
+        wheel.advance()
+    fired = []
+    delays = [4096, 1, 70, 64, 63, 5000, 1]
+    for i, delay in enumerate(delays):
+        wheel.schedule(delay, lambda i=i: fired.append((wheel.now, i)))
+    for _ in range(6000):
+        wheel.advance()
+    expected = sorted((50 + delay, i) for i, delay in enumerate(delays))
+    assert fired == expected
+
+
+def test_cancelled_timer_does_not_fire():
+    wheel = TimerWheel()
+    fired = []
+    near = wheel.schedule(10, lambda: fired.append("near"))
+    far = wheel.schedule(5000, lambda: fired.append("far"))
+    wheel.schedule(20, lambda: fired.append("kept"))
+    near.cancel()
+    for _ in range(4200):
+        wheel.advance()
+    # Cancelled after it has been cascaded down from the top level
+    far.cancel()
+    for _ in range(1000):
+        wheel.advance()
+    assert fired == ["kept"]
+    assert near.callback is None and far.callback is None
+
+
+def test_delay_below_one_fires_next_tick():
+    wheel = TimerWheel()
+    fired = []
+    wheel.schedule(0, lambda: fired.append(wheel.now))
+    wheel.advance()
+    assert fired == [1]
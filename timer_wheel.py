@@ -0,0 +1,73 @@
+# Timer wheel for fortnite_2d.py.
+#
+# Countdowns (particle and bullet lifetimes, damage log lines) are scheduled
+# here instead of being decremented on every object every frame. The game
+# advances the wheel once per tick; `now` is the tick count that weapon,
+# storm and bot deadlines are compared against.
+
+
+class Timer:
+    def __init__(self, expires, callback):
+        self.expires = expires
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        # Drop the callback so a cancelled timer doesn't keep its owner alive
+        self.cancelled = True
+        self.callback = None
+
+
+class TimerWheel:
+    # Hierarchical timer wheel. Level 0 has one slot per tick; each slot of a
+    # higher level covers a full lap of the level below and is cascaded down
+    # when that lap starts. Advancing only touches the timers that are due
+    # (plus the occasional cascade), not every live timer.
+    def __init__(self, slots=64, levels=3):
+        self.slots = slots
+        self.levels = levels
+        self.reset()
+
+    def reset(self):
+        self.now = 0
+        self.wheels = [[[] for _ in range(self.slots)] for _ in range(self.levels)]
+
+    def schedule(self, delay, callback):
+        timer = Timer(self.now + max(1, int(delay)), callback)
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        delta = timer.expires - self.now
+        span = 1
+        for level in range(self.levels):
+            # Timers past the last level wait in it and get re-inserted
+            if delta < span * self.slots or level == self.levels - 1:
+                self.wheels[level][(timer.expires // span) % self.slots].append(timer)
+                return
+            span *= self.slots
+
+    def advance(self):
+        self.now += 1
+        
+        # Cascade from the highest level whose lap just started
+        top = 0
+        span = self.slots
+        while top + 1 < self.levels and self.now % span == 0:
+            top += 1
+            span *= self.slots
+        for level in range(top, 0, -1):
+            index = (self.now // self.slots ** level) % self.slots
+            due = self.wheels[level][index]
+            self.wheels[level][index] = []
+            for timer in due:
+                if not timer.cancelled:
+                    self._insert(timer)
+        
+        # Fire everything expiring this tick
+        index = self.now % self.slots
+        due = self.wheels[0][index]
+        self.wheels[0][index] = []
+        for timer in due:
+            if not timer.cancelled:
+                timer.callback()